@@ -27,6 +27,9 @@ from eva.configuration.constants import (
 class ConfigurationManager(object):
     _instance = None
     _yml_path = EVA_DEFAULT_DIR / EVA_CONFIG_FILE
+    # parsed yaml file, keyed by the file's (mtime, size) when it was read
+    _config_obj = None
+    _config_stamp = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -43,26 +46,40 @@ class ConfigurationManager(object):
                 eva_installation_dir=EVA_INSTALLATION_DIR,
             )
 
+    @classmethod
+    def _load(cls) -> Any:
+        """
+        Returns the parsed yaml file. The file is only parsed again if it
+        changed on disk since the last read, as the optimizer queries the
+        configuration for every plan it builds.
+        """
+        stat = cls._yml_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if cls._config_obj is None or cls._config_stamp != stamp:
+            with cls._yml_path.open("r") as yml_file:
+                cls._config_obj = yaml.load(yml_file, Loader=yaml.FullLoader)
+            cls._config_stamp = stamp
+        return cls._config_obj
+
     @classmethod
     def _get(cls, category: str, key: str) -> Any:
-        with cls._yml_path.open("r") as yml_file:
-            config_obj = yaml.load(yml_file, Loader=yaml.FullLoader)
-            if config_obj is None:
-                raise ValueError(f"Invalid yaml file at {cls._yml_path}")
-            key_error = (
-                f"Add the entry '{category}: {key}' to the yaml file. Or, if "
-                f"you did not modify the yaml file, remove it (rm {cls._yml_path}),"
-                f"and the system will auto-generate one."
+        config_obj = cls._load()
+        if config_obj is None:
+            raise ValueError(f"Invalid yaml file at {cls._yml_path}")
+        key_error = (
+            f"Add the entry '{category}: {key}' to the yaml file. Or, if "
+            f"you did not modify the yaml file, remove it (rm {cls._yml_path}),"
+            f"and the system will auto-generate one."
+        )
+        if category not in config_obj:
+            raise KeyError(
+                f"Missing category '{category}' in the yaml file at {cls._yml_path}. {key_error}"
             )
-            if category not in config_obj:
-                raise KeyError(
-                    f"Missing category '{category}' in the yaml file at {cls._yml_path}. {key_error}"
-                )
-            if key not in config_obj[category]:
-                raise KeyError(
-                    f"Missing key {key} for the category {category} in the yaml file at {cls._yml_path}. {key_error}"
-                )
-            return config_obj[category][key]
+        if key not in config_obj[category]:
+            raise KeyError(
+                f"Missing key {key} for the category {category} in the yaml file at {cls._yml_path}. {key_error}"
+            )
+        return config_obj[category][key]
 
     @classmethod
     def _update(cls, category: str, key: str, value: str):
@@ -86,6 +103,8 @@ class ConfigurationManager(object):
             yml_file.seek(0)
             yml_file.write(yaml.dump(config_obj))
             yml_file.truncate()
+        # force the next read to parse the updated file
+        cls._config_obj = None
 
     @classmethod
     def get_value(cls, category: str, key: str) -> Any:
@@ -38,13 +38,16 @@ from eva.planner.storage_plan import StoragePlan
 
 
 class LogicalExchangeToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALEXCHANGE)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_EXCHANGE_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_EXCHANGE_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_EXCHANGE_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_EXCHANGE_TO_PHYSICAL,
+        )
 
     def check(self, grp_id: int, context: OptimizerContext):
         return True
@@ -57,13 +60,16 @@ class LogicalExchangeToPhysical(Rule):
 
 
 class LogicalProjectToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALPROJECT)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_PROJECT_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_PROJECT_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_PROJECT_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_PROJECT_TO_PHYSICAL,
+        )
 
     def check(self, grp_id: int, context: OptimizerContext):
         return True
@@ -78,12 +84,13 @@ class LogicalProjectToPhysical(Rule):
 
 
 class LogicalGetToSeqScan(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALGET)
-        super().__init__(RuleType.LOGICAL_GET_TO_SEQSCAN, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_GET_TO_SEQSCAN
+        super().__init__(
+            RuleType.LOGICAL_GET_TO_SEQSCAN, pattern, Promise.LOGICAL_GET_TO_SEQSCAN
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -99,7 +106,6 @@ class LogicalGetToSeqScan(Rule):
         )
         if config_batch_mem_size:
             batch_mem_size = config_batch_mem_size
-        scan = SeqScanPlan(None, before.target_list, before.alias)
         lower = ExchangePlan(parallelism=1)
         lower.append_child(
             StoragePlan(
@@ -109,7 +115,7 @@ class LogicalGetToSeqScan(Rule):
                 sampling_rate=before.sampling_rate,
             )
         )
-        scan.append_child(lower)
+        scan = SeqScanPlan(None, before.target_list, before.alias, children=[lower])
         # Check whether the projection contains a UDF
         if before.target_list is None or not any(
             [isinstance(expr, FunctionExpression) for expr in before.target_list]
@@ -34,6 +34,78 @@ class Binder:
         for expr in grp.logical_exprs:
             yield from Binder._binder(expr, pattern, memo)
 
+    @staticmethod
+    def _grp_match(idx: int, pattern: Pattern, memo: Memo) -> bool:
+        """
+        Checks whether any logical expression in the group structurally
+        matches the pattern. Results are memoized in the memo so that
+        repeated descents across rules collapse to dict lookups.
+
+        The groups are walked with an explicit stack instead of recursion.
+        A frame checks its candidate expressions one at a time, and the
+        children of a candidate in order. A child whose result is not cached
+        yet suspends the frame until it is resolved. The first failing child
+        rejects the candidate and the first matching candidate decides the
+        group, so the walk short-circuits like any/all would.
+        """
+        if pattern.opr_type is OperatorType.DUMMY:
+            return True
+
+        # frame: [group id, pattern, candidates, candidate index, child index,
+        #         groups read]
+        stack = [[idx, pattern, None, 0, 0, None]]
+        while stack:
+            frame = stack[-1]
+            grp_id, ptn, candidates, cand_idx, child_idx, dep_ids = frame
+            if candidates is None:
+                if memo.get_pattern_match(grp_id, ptn) is not None:
+                    stack.pop()
+                    continue
+                candidates = [
+                    expr
+                    for expr in memo.groups[grp_id].logical_exprs
+                    if len(expr.children) == ptn.arity
+                    and expr.opr.opr_type is ptn.opr_type
+                ]
+                dep_ids = [grp_id]
+                frame[2], frame[5] = candidates, dep_ids
+
+            matched = False
+            pending = None
+            while cand_idx < len(candidates):
+                expr = candidates[cand_idx]
+                while child_idx < ptn.arity:
+                    child_ptn = ptn.children[child_idx]
+                    if child_ptn.opr_type is not OperatorType.DUMMY:
+                        child_grp = expr.children[child_idx]
+                        child_matched = memo.get_pattern_match(child_grp, child_ptn)
+                        if child_matched is None:
+                            pending = (child_grp, child_ptn)
+                            break
+                        dep_ids.append(child_grp)
+                        if not child_matched:
+                            break
+                    child_idx += 1
+                if pending is not None:
+                    break
+                if child_idx == ptn.arity:
+                    matched = True
+                    break
+                # a child does not match, try the next candidate
+                cand_idx += 1
+                child_idx = 0
+
+            if pending is not None:
+                # resolve the child first, then resume from the same position
+                frame[3], frame[4] = cand_idx, child_idx
+                stack.append([pending[0], pending[1], None, 0, 0, None])
+                continue
+
+            stack.pop()
+            memo.add_pattern_match(grp_id, ptn, matched, dep_ids)
+
+        return memo.get_pattern_match(idx, pattern)
+
     @staticmethod
     def _binder(expr: GroupExpression, pattern: Pattern, memo: Memo):
         assert isinstance(expr, GroupExpression)
@@ -41,13 +113,17 @@ class Binder:
         child_binders = []
         if pattern.opr_type is not OperatorType.DUMMY:
             curr_iterator = iter([expr.opr])
-            if expr.opr.opr_type != pattern.opr_type:
-                return
-
-            if len(pattern.children) != len(expr.children):
+            # the child count rejects most candidates, check it first
+            if (
+                len(expr.children) != pattern.arity
+                or expr.opr.opr_type is not pattern.opr_type
+            ):
                 return
 
             for child_grp, pattern_child in zip(expr.children, pattern.children):
+                # skip building the binders if a child group can never match
+                if not Binder._grp_match(child_grp, pattern_child, memo):
+                    return
                 child_binders.append(Binder._grp_binder(child_grp, pattern_child, memo))
         else:
             # record the group id in a Dummy Opearator
@@ -35,7 +35,9 @@ class GroupExpression:
         self._opr = opr
         self._group_id = group_id
         self._children = children
-        self._rules_explored = RuleType.INVALID_RULE
+        # explored rules are tracked as a plain int bitmask to avoid the
+        # Flag combination machinery on every rule check
+        self._rules_explored = RuleType.INVALID_RULE.value
 
     @property
     def opr(self):
@@ -62,16 +64,17 @@ class GroupExpression:
 
     @property
     def rules_explored(self):
-        return self._rules_explored
+        return RuleType(self._rules_explored)
 
     def is_logical(self):
         return self.opr.is_logical()
 
     def mark_rule_explored(self, rule_id: RuleType):
-        self._rules_explored |= rule_id
+        self._rules_explored |= rule_id.value
 
     def is_rule_explored(self, rule_id: RuleType):
-        return (self._rules_explored & rule_id) == rule_id
+        rule_value = rule_id.value
+        return (self._rules_explored & rule_value) == rule_value
 
     def __eq__(self, other: "GroupExpression"):
         return (
@@ -12,12 +12,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from eva.constants import UNDEFINED_GROUP_ID
 from eva.optimizer.group import Group
 from eva.optimizer.group_expression import GroupExpression
 from eva.optimizer.operators import OperatorType
+from eva.optimizer.rules.pattern import Pattern
 from eva.utils.logging_manager import logger
 
 
@@ -30,6 +31,11 @@ class Memo:
         # map from hash to group_expr to speed up finding duplicates
         self._group_exprs: Dict[int, GroupExpression] = dict()
         self._groups = dict()
+        # map from (group_id, pattern) to whether the group structurally
+        # matches the pattern; equal patterns of different rules share entries
+        self._pattern_match_cache: Dict[Tuple[int, Pattern], bool] = dict()
+        # reverse index from group_id to the cached matches that read it
+        self._pattern_match_deps: Dict[int, List[Tuple[int, Pattern]]] = dict()
 
     @property
     def groups(self):
@@ -51,11 +57,42 @@ class Memo:
         else:
             logger.error("Missing group id")
 
+    def get_pattern_match(self, group_id: int, pattern: Pattern) -> bool:
+        """
+        Returns the cached match result of the group against the pattern,
+        None if it has not been computed yet
+        """
+        return self._pattern_match_cache.get((group_id, pattern), None)
+
+    def add_pattern_match(
+        self, group_id: int, pattern: Pattern, matched: bool, dep_ids: List[int]
+    ):
+        """
+        Caches the match result of the group against the pattern. dep_ids
+        are the groups read while matching; the entry is dropped whenever
+        any of them is modified
+        """
+        key = (group_id, pattern)
+        self._pattern_match_cache[key] = matched
+        for dep_id in dep_ids:
+            self._pattern_match_deps.setdefault(dep_id, []).append(key)
+
     """
     For the consistency of the memo, all modification should use the
     following functions.
     """
 
+    def _invalidate_pattern_matches(self, group_id: int):
+        """
+        Drops the cached matches that depend on the group
+        """
+        worklist = [group_id]
+        while worklist:
+            for key in self._pattern_match_deps.pop(worklist.pop(), []):
+                if self._pattern_match_cache.pop(key, None) is not None:
+                    # matches of the parent groups depend on this entry
+                    worklist.append(key[0])
+
     def _get_table_aliases(self, expr: GroupExpression) -> List[str]:
         """
         Collects table aliases of all the children
@@ -91,6 +128,9 @@ class Memo:
         group = self.groups[group_id]
         group.add_expr(expr)
         self._group_exprs[hash(expr)] = expr
+        # structural matches only read the logical expressions
+        if expr.opr.is_logical():
+            self._invalidate_pattern_matches(group_id)
 
     def erase_group(self, group_id: int):
         """
@@ -103,6 +143,7 @@ class Memo:
             del self._group_exprs[hash(expr)]
 
         group.clear_grp_exprs()
+        self._invalidate_pattern_matches(group_id)
 
     def add_group_expr(
         self, expr: GroupExpression, group_id: int = UNDEFINED_GROUP_ID
@@ -171,15 +171,13 @@ class OptimizeExpression(OptimizerTask):
         super().__init__(optimizer_context, OptimizerTaskType.OPTIMIZE_EXPRESSION)
 
     def execute(self):
-        all_rules = RulesManager().logical_rules
+        # only the rules rooted at the operator type and arity can match
+        opr_type = self.root_expr.opr.opr_type
+        arity = len(self.root_expr.children)
+        valid_rules = list(RulesManager().logical_rules_for(opr_type, arity))
         # if exploring, we don't need to consider implementation rules
         if not self.explore:
-            all_rules.extend(RulesManager().implementation_rules)
-
-        valid_rules = []
-        for rule in all_rules:
-            if rule.top_match(self.root_expr.opr):
-                valid_rules.append(rule)
+            valid_rules.extend(RulesManager().implementation_rules_for(opr_type, arity))
 
         sorted(valid_rules, key=lambda x: x.promise())
 
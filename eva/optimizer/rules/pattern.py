@@ -18,12 +18,20 @@ from eva.optimizer.operators import OperatorType
 
 
 class Pattern:
+    __slots__ = ("_opr_type", "_chilren", "_arity", "_hash")
+
     def __init__(self, opr_type: OperatorType):
         self._opr_type = opr_type
         self._chilren = []
+        self._arity = 0
+        # computed on first use; hashing a pattern also hashes its children,
+        # so the whole tree is frozen from then on
+        self._hash = None
 
     def append_child(self, child: Pattern):
+        assert self._hash is None, "Pattern cannot be modified after it is hashed"
         self._chilren.append(child)
+        self._arity = len(self._chilren)
 
     @property
     def children(self):
@@ -32,3 +40,33 @@ class Pattern:
     @property
     def opr_type(self):
         return self._opr_type
+
+    @property
+    def arity(self):
+        return self._arity
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Pattern):
+            return False
+        # compare structurally; hashing here would freeze both patterns, so
+        # only hashes that are already cached are used as a shortcut
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+        return (
+            self._opr_type is other._opr_type
+            and self._arity == other._arity
+            and self._chilren == other._chilren
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(
+                (self._opr_type, tuple(hash(child) for child in self._chilren))
+            )
+        return self._hash
@@ -14,6 +14,8 @@
 # limitations under the License.
 from __future__ import annotations
 
+import copy
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from eva.catalog.catalog_type import TableType
@@ -88,14 +90,53 @@ from eva.planner.upload_plan import UploadPlan
 # REWRITE RULES START
 
 
+class _EmbedIntoGet(Rule):
+    """Copies an attribute of the root operator into the get operator below it
+
+    Table driven base for the rewrite rules that only differ in the copied
+    attribute. The get operator is shallow copied so that the operator in
+    the group expression is left untouched.
+
+    Arguments:
+        src_attr(str): attribute of the root operator to embed
+        dst_attr(str): attribute of the get operator to overwrite
+    """
+
+    __slots__ = ("_src_getter", "_dst_attr")
+
+    def __init__(
+        self,
+        rule_type: RuleType,
+        pattern: Pattern,
+        promise: Promise,
+        src_attr: str,
+        dst_attr: str,
+    ):
+        super().__init__(rule_type, pattern, promise)
+        self._src_getter = attrgetter(src_attr)
+        self._dst_attr = dst_attr
+
+    def check(self, before: Operator, context: OptimizerContext):
+        # nothing else to check if logical match found return true
+        return True
+
+    def apply(self, before: Operator, context: OptimizerContext):
+        get_opr = before.children[0]
+        new_get_opr = copy.copy(get_opr)
+        new_get_opr.children = list(get_opr.children)
+        setattr(new_get_opr, self._dst_attr, self._src_getter(before))
+        return new_get_opr
+
+
 class EmbedFilterIntoGet(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALFILTER)
         pattern.append_child(Pattern(OperatorType.LOGICALGET))
-        super().__init__(RuleType.EMBED_FILTER_INTO_GET, pattern)
-
-    def promise(self):
-        return Promise.EMBED_FILTER_INTO_GET
+        super().__init__(
+            RuleType.EMBED_FILTER_INTO_GET, pattern, Promise.EMBED_FILTER_INTO_GET
+        )
 
     def check(self, before: LogicalFilter, context: OptimizerContext):
         # System supports predicate pushdown only while reading video data
@@ -120,6 +161,11 @@ class EmbedFilterIntoGet(Rule):
             predicate, col_alias
         )
         if pushdown_pred:
+            # keep the conjuncts already embedded into the get
+            if lget.predicate is not None:
+                pushdown_pred = conjuction_list_to_expression_tree(
+                    [lget.predicate, pushdown_pred]
+                )
             new_get_opr = LogicalGet(
                 lget.video,
                 lget.dataset_metadata,
@@ -139,13 +185,14 @@ class EmbedFilterIntoGet(Rule):
 
 
 class EmbedSampleIntoGet(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALSAMPLE)
         pattern.append_child(Pattern(OperatorType.LOGICALGET))
-        super().__init__(RuleType.EMBED_SAMPLE_INTO_GET, pattern)
-
-    def promise(self):
-        return Promise.EMBED_SAMPLE_INTO_GET
+        super().__init__(
+            RuleType.EMBED_SAMPLE_INTO_GET, pattern, Promise.EMBED_SAMPLE_INTO_GET
+        )
 
     def check(self, before: LogicalSample, context: OptimizerContext):
         # System supports sample pushdown only while reading video data
@@ -169,104 +216,73 @@ class EmbedSampleIntoGet(Rule):
         return new_get_opr
 
 
-class EmbedProjectIntoGet(Rule):
+class EmbedProjectIntoGet(_EmbedIntoGet):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALPROJECT)
         pattern.append_child(Pattern(OperatorType.LOGICALGET))
-        super().__init__(RuleType.EMBED_PROJECT_INTO_GET, pattern)
-
-    def promise(self):
-        return Promise.EMBED_PROJECT_INTO_GET
-
-    def check(self, before: Operator, context: OptimizerContext):
-        # nothing else to check if logical match found return true
-        return True
-
-    def apply(self, before: LogicalProject, context: OptimizerContext):
-        target_list = before.target_list
-        lget = before.children[0]
-        new_get_opr = LogicalGet(
-            lget.video,
-            lget.dataset_metadata,
-            alias=lget.alias,
-            predicate=lget.predicate,
-            target_list=target_list,
-            sampling_rate=lget.sampling_rate,
-            children=lget.children,
+        super().__init__(
+            RuleType.EMBED_PROJECT_INTO_GET,
+            pattern,
+            Promise.EMBED_PROJECT_INTO_GET,
+            "target_list",
+            "target_list",
         )
 
-        return new_get_opr
-
 
 # For nested queries
 
 
-class EmbedFilterIntoDerivedGet(Rule):
+class EmbedFilterIntoDerivedGet(_EmbedIntoGet):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALFILTER)
         pattern_get = Pattern(OperatorType.LOGICALQUERYDERIVEDGET)
         pattern_get.append_child(Pattern(OperatorType.DUMMY))
         pattern.append_child(pattern_get)
-        super().__init__(RuleType.EMBED_FILTER_INTO_DERIVED_GET, pattern)
-
-    def promise(self):
-        return Promise.EMBED_FILTER_INTO_DERIVED_GET
-
-    def check(self, before: Operator, context: OptimizerContext):
-        # nothing else to check if logical match found return true
-        return True
-
-    def apply(self, before: LogicalFilter, context: OptimizerContext):
-        predicate = before.predicate
-        ld_get = before.children[0]
-        new_opr = LogicalQueryDerivedGet(
-            alias=ld_get.alias,
-            predicate=predicate,
-            target_list=ld_get.target_list,
-            children=ld_get.children,
+        super().__init__(
+            RuleType.EMBED_FILTER_INTO_DERIVED_GET,
+            pattern,
+            Promise.EMBED_FILTER_INTO_DERIVED_GET,
+            "predicate",
+            "predicate",
         )
-        return new_opr
 
 
-class EmbedProjectIntoDerivedGet(Rule):
+class EmbedProjectIntoDerivedGet(_EmbedIntoGet):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALPROJECT)
         pattern_get = Pattern(OperatorType.LOGICALQUERYDERIVEDGET)
         pattern_get.append_child(Pattern(OperatorType.DUMMY))
         pattern.append_child(pattern_get)
-        super().__init__(RuleType.EMBED_PROJECT_INTO_DERIVED_GET, pattern)
-
-    def promise(self):
-        return Promise.EMBED_PROJECT_INTO_DERIVED_GET
-
-    def check(self, before: Operator, context: OptimizerContext):
-        # nothing else to check if logical match found return true
-        return True
-
-    def apply(self, before: LogicalProject, context: OptimizerContext):
-        target_list = before.target_list
-        ld_get = before.children[0]
-        new_opr = LogicalQueryDerivedGet(
-            alias=ld_get.alias,
-            predicate=ld_get.predicate,
-            target_list=target_list,
-            children=ld_get.children,
+        super().__init__(
+            RuleType.EMBED_PROJECT_INTO_DERIVED_GET,
+            pattern,
+            Promise.EMBED_PROJECT_INTO_DERIVED_GET,
+            "target_list",
+            "target_list",
         )
-        return new_opr
 
 
 # Join Queries
 class PushDownFilterThroughJoin(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALFILTER)
         pattern_join = Pattern(OperatorType.LOGICALJOIN)
         pattern_join.append_child(Pattern(OperatorType.DUMMY))
         pattern_join.append_child(Pattern(OperatorType.DUMMY))
         pattern.append_child(pattern_join)
-        super().__init__(RuleType.PUSHDOWN_FILTER_THROUGH_JOIN, pattern)
-
-    def promise(self):
-        return Promise.PUSHDOWN_FILTER_THROUGH_JOIN
+        super().__init__(
+            RuleType.PUSHDOWN_FILTER_THROUGH_JOIN,
+            pattern,
+            Promise.PUSHDOWN_FILTER_THROUGH_JOIN,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -323,14 +339,17 @@ class PushDownFilterThroughJoin(Rule):
 
 
 class LogicalInnerJoinCommutativity(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALJOIN)
         pattern.append_child(Pattern(OperatorType.DUMMY))
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_INNER_JOIN_COMMUTATIVITY, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_INNER_JOIN_COMMUTATIVITY
+        super().__init__(
+            RuleType.LOGICAL_INNER_JOIN_COMMUTATIVITY,
+            pattern,
+            Promise.LOGICAL_INNER_JOIN_COMMUTATIVITY,
+        )
 
     def check(self, before: LogicalJoin, context: OptimizerContext):
         # has to be an inner join
@@ -354,117 +373,142 @@ class LogicalInnerJoinCommutativity(Rule):
 ##############################################
 # IMPLEMENTATION RULES START
 
+# Getters for the operator fields copied verbatim into the physical plans.
+# A single attrgetter call returns all the fields as a tuple.
+_CREATE_FIELDS = attrgetter("video", "column_list", "if_not_exists")
+_RENAME_FIELDS = attrgetter("old_table_ref", "new_name")
+_DROP_FIELDS = attrgetter("table_refs", "if_exists")
+_CREATE_UDF_FIELDS = attrgetter(
+    "name", "if_not_exists", "inputs", "outputs", "impl_path", "udf_type"
+)
+_DROP_UDF_FIELDS = attrgetter("name", "if_exists")
+_INSERT_FIELDS = attrgetter("table_metainfo", "column_list", "value_list")
+_LOAD_FIELDS = attrgetter("table_info", "path", "column_list", "file_options")
+_UPLOAD_FIELDS = attrgetter(
+    "path", "video_blob", "table_info", "column_list", "file_options"
+)
+
 
 class LogicalCreateToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALCREATE)
-        super().__init__(RuleType.LOGICAL_CREATE_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_CREATE_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_CREATE_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_CREATE_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
 
     def apply(self, before: LogicalCreate, context: OptimizerContext):
-        after = CreatePlan(before.video, before.column_list, before.if_not_exists)
+        after = CreatePlan(*_CREATE_FIELDS(before))
         return after
 
 
 class LogicalRenameToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALRENAME)
-        super().__init__(RuleType.LOGICAL_RENAME_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_RENAME_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_RENAME_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_RENAME_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
 
     def apply(self, before: LogicalRename, context: OptimizerContext):
-        after = RenamePlan(before.old_table_ref, before.new_name)
+        after = RenamePlan(*_RENAME_FIELDS(before))
         return after
 
 
 class LogicalDropToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALDROP)
-        super().__init__(RuleType.LOGICAL_DROP_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_DROP_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_DROP_TO_PHYSICAL, pattern, Promise.LOGICAL_DROP_TO_PHYSICAL
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
 
     def apply(self, before: LogicalDrop, context: OptimizerContext):
-        after = DropPlan(before.table_refs, before.if_exists)
+        after = DropPlan(*_DROP_FIELDS(before))
         return after
 
 
 class LogicalCreateUDFToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALCREATEUDF)
-        super().__init__(RuleType.LOGICAL_CREATE_UDF_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_CREATE_UDF_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_CREATE_UDF_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_CREATE_UDF_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
 
     def apply(self, before: LogicalCreateUDF, context: OptimizerContext):
-        after = CreateUDFPlan(
-            before.name,
-            before.if_not_exists,
-            before.inputs,
-            before.outputs,
-            before.impl_path,
-            before.udf_type,
-        )
+        after = CreateUDFPlan(*_CREATE_UDF_FIELDS(before))
         return after
 
 
 class LogicalDropUDFToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALDROPUDF)
-        super().__init__(RuleType.LOGICAL_DROP_UDF_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_DROP_UDF_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_DROP_UDF_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_DROP_UDF_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
 
     def apply(self, before: LogicalDropUDF, context: OptimizerContext):
-        after = DropUDFPlan(before.name, before.if_exists)
+        after = DropUDFPlan(*_DROP_UDF_FIELDS(before))
         return after
 
 
 class LogicalInsertToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALINSERT)
-        super().__init__(RuleType.LOGICAL_INSERT_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_INSERT_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_INSERT_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_INSERT_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
 
     def apply(self, before: LogicalInsert, context: OptimizerContext):
-        after = InsertPlan(before.table_metainfo, before.column_list, before.value_list)
+        after = InsertPlan(*_INSERT_FIELDS(before))
         return after
 
 
 class LogicalLoadToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALLOADDATA)
-        super().__init__(RuleType.LOGICAL_LOAD_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_LOAD_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_LOAD_TO_PHYSICAL, pattern, Promise.LOGICAL_LOAD_TO_PHYSICAL
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -480,23 +524,23 @@ class LogicalLoadToPhysical(Rule):
         )
         if config_batch_mem_size:
             batch_mem_size = config_batch_mem_size
+        table_info, path, column_list, file_options = _LOAD_FIELDS(before)
         after = LoadDataPlan(
-            before.table_info,
-            before.path,
-            batch_mem_size,
-            before.column_list,
-            before.file_options,
+            table_info, path, batch_mem_size, column_list, file_options
         )
         return after
 
 
 class LogicalUploadToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALUPLOAD)
-        super().__init__(RuleType.LOGICAL_UPLOAD_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_UPLOAD_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_UPLOAD_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_UPLOAD_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -512,25 +556,22 @@ class LogicalUploadToPhysical(Rule):
         )
         if config_batch_mem_size:
             batch_mem_size = config_batch_mem_size
+        path, video_blob, table_info, column_list, file_options = _UPLOAD_FIELDS(before)
         after = UploadPlan(
-            before.path,
-            before.video_blob,
-            before.table_info,
-            batch_mem_size,
-            before.column_list,
-            before.file_options,
+            path, video_blob, table_info, batch_mem_size, column_list, file_options
         )
 
         return after
 
 
 class LogicalGetToSeqScan(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALGET)
-        super().__init__(RuleType.LOGICAL_GET_TO_SEQSCAN, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_GET_TO_SEQSCAN
+        super().__init__(
+            RuleType.LOGICAL_GET_TO_SEQSCAN, pattern, Promise.LOGICAL_GET_TO_SEQSCAN
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -546,26 +587,33 @@ class LogicalGetToSeqScan(Rule):
         )
         if config_batch_mem_size:
             batch_mem_size = config_batch_mem_size
-        after = SeqScanPlan(None, before.target_list, before.alias)
-        after.append_child(
-            StoragePlan(
-                before.dataset_metadata,
-                batch_mem_size=batch_mem_size,
-                predicate=before.predicate,
-                sampling_rate=before.sampling_rate,
-            )
+        after = SeqScanPlan(
+            None,
+            before.target_list,
+            before.alias,
+            children=[
+                StoragePlan(
+                    before.dataset_metadata,
+                    batch_mem_size=batch_mem_size,
+                    predicate=before.predicate,
+                    sampling_rate=before.sampling_rate,
+                )
+            ],
         )
         return after
 
 
 class LogicalSampleToUniformSample(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALSAMPLE)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_SAMPLE_TO_UNIFORMSAMPLE, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_SAMPLE_TO_UNIFORMSAMPLE
+        super().__init__(
+            RuleType.LOGICAL_SAMPLE_TO_UNIFORMSAMPLE,
+            pattern,
+            Promise.LOGICAL_SAMPLE_TO_UNIFORMSAMPLE,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -578,33 +626,43 @@ class LogicalSampleToUniformSample(Rule):
 
 
 class LogicalDerivedGetToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALQUERYDERIVEDGET)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_DERIVED_GET_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_DERIVED_GET_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_DERIVED_GET_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_DERIVED_GET_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
 
     def apply(self, before: LogicalQueryDerivedGet, context: OptimizerContext):
-        after = SeqScanPlan(before.predicate, before.target_list, before.alias)
-        after.append_child(before.children[0])
+        after = SeqScanPlan(
+            before.predicate,
+            before.target_list,
+            before.alias,
+            children=[before.children[0]],
+        )
         return after
 
 
 class LogicalUnionToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALUNION)
         # add 2 dummy children
         pattern.append_child(Pattern(OperatorType.DUMMY))
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_UNION_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_UNION_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_UNION_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_UNION_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -617,13 +675,16 @@ class LogicalUnionToPhysical(Rule):
 
 
 class LogicalGroupByToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALGROUPBY)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_GROUPBY_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_GROUPBY_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_GROUPBY_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_GROUPBY_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -636,13 +697,16 @@ class LogicalGroupByToPhysical(Rule):
 
 
 class LogicalOrderByToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALORDERBY)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_ORDERBY_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_ORDERBY_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_ORDERBY_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_ORDERBY_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -655,13 +719,16 @@ class LogicalOrderByToPhysical(Rule):
 
 
 class LogicalLimitToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALLIMIT)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_LIMIT_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_LIMIT_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_LIMIT_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_LIMIT_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -674,12 +741,15 @@ class LogicalLimitToPhysical(Rule):
 
 
 class LogicalFunctionScanToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALFUNCTIONSCAN)
-        super().__init__(RuleType.LOGICAL_FUNCTION_SCAN_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_FUNCTION_SCAN_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_FUNCTION_SCAN_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_FUNCTION_SCAN_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return True
@@ -690,14 +760,17 @@ class LogicalFunctionScanToPhysical(Rule):
 
 
 class LogicalLateralJoinToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALJOIN)
         pattern.append_child(Pattern(OperatorType.DUMMY))
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_LATERAL_JOIN_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_LATERAL_JOIN_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_LATERAL_JOIN_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_LATERAL_JOIN_TO_PHYSICAL,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         if before.join_type == JoinType.LATERAL_JOIN:
@@ -714,14 +787,17 @@ class LogicalLateralJoinToPhysical(Rule):
 
 
 class LogicalJoinToPhysicalHashJoin(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALJOIN)
         pattern.append_child(Pattern(OperatorType.DUMMY))
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_JOIN_TO_PHYSICAL_HASH_JOIN, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_JOIN_TO_PHYSICAL_HASH_JOIN
+        super().__init__(
+            RuleType.LOGICAL_JOIN_TO_PHYSICAL_HASH_JOIN,
+            pattern,
+            Promise.LOGICAL_JOIN_TO_PHYSICAL_HASH_JOIN,
+        )
 
     def check(self, before: Operator, context: OptimizerContext):
         return before.join_type == JoinType.INNER_JOIN
@@ -756,13 +832,16 @@ class LogicalJoinToPhysicalHashJoin(Rule):
 
 
 class LogicalCreateMaterializedViewToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICAL_CREATE_MATERIALIZED_VIEW)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_MATERIALIZED_VIEW_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_MATERIALIZED_VIEW_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_MATERIALIZED_VIEW_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_MATERIALIZED_VIEW_TO_PHYSICAL,
+        )
 
     def check(self, grp_id: int, context: OptimizerContext):
         return True
@@ -779,13 +858,16 @@ class LogicalCreateMaterializedViewToPhysical(Rule):
 
 
 class LogicalFilterToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALFILTER)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_FILTER_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_FILTER_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_FILTER_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_FILTER_TO_PHYSICAL,
+        )
 
     def check(self, grp_id: int, context: OptimizerContext):
         return True
@@ -798,13 +880,16 @@ class LogicalFilterToPhysical(Rule):
 
 
 class LogicalProjectToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALPROJECT)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_PROJECT_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_PROJECT_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_PROJECT_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_PROJECT_TO_PHYSICAL,
+        )
 
     def check(self, grp_id: int, context: OptimizerContext):
         return True
@@ -817,12 +902,13 @@ class LogicalProjectToPhysical(Rule):
 
 
 class LogicalShowToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICAL_SHOW)
-        super().__init__(RuleType.LOGICAL_SHOW_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_SHOW_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_SHOW_TO_PHYSICAL, pattern, Promise.LOGICAL_SHOW_TO_PHYSICAL
+        )
 
     def check(self, grp_id: int, context: OptimizerContext):
         return True
@@ -833,13 +919,16 @@ class LogicalShowToPhysical(Rule):
 
 
 class LogicalExplainToPhysical(Rule):
+    __slots__ = ()
+
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALEXPLAIN)
         pattern.append_child(Pattern(OperatorType.DUMMY))
-        super().__init__(RuleType.LOGICAL_EXPLAIN_TO_PHYSICAL, pattern)
-
-    def promise(self):
-        return Promise.LOGICAL_EXPLAIN_TO_PHYSICAL
+        super().__init__(
+            RuleType.LOGICAL_EXPLAIN_TO_PHYSICAL,
+            pattern,
+            Promise.LOGICAL_EXPLAIN_TO_PHYSICAL,
+        )
 
     def check(self, grp_id: int, context: OptimizerContext):
         return True
@@ -128,11 +128,17 @@ class Rule(ABC):
         rule_type(RuleType): type of the rule, can be rewrite,
             logical->physical
         pattern: the match pattern for the rule
+        promise(Promise): order in which the rule should be applied
     """
 
-    def __init__(self, rule_type: RuleType, pattern=None):
+    __slots__ = ("_pattern", "_rule_type", "_root_type", "_promise_value")
+
+    def __init__(self, rule_type: RuleType, pattern, promise: Promise):
         self._pattern = pattern
         self._rule_type = rule_type
+        self._root_type = pattern.opr_type
+        # cached as a raw int, the optimizer sorts rules by it
+        self._promise_value = int(promise)
 
     @property
     def rule_type(self):
@@ -145,13 +151,14 @@ class Rule(ABC):
     @pattern.setter
     def pattern(self, pattern):
         self._pattern = pattern
+        self._root_type = pattern.opr_type
 
     def top_match(self, opr: Operator) -> bool:
-        return opr.opr_type == self.pattern.opr_type
+        # operator types are enum members, so identity is enough
+        return opr.opr_type is self._root_type
 
-    @abstractmethod
     def promise(self) -> int:
-        raise NotImplementedError
+        return self._promise_value
 
     @abstractmethod
     def check(self, before: Operator, context: OptimizerContext) -> bool:
@@ -14,6 +14,9 @@
 # limitations under the License.
 from __future__ import annotations
 
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
 from eva.configuration.configuration_manager import ConfigurationManager
 from eva.experimental.ray.optimizer.rules.rules import LogicalExchangeToPhysical
 from eva.experimental.ray.optimizer.rules.rules import (
@@ -22,6 +25,7 @@ from eva.experimental.ray.optimizer.rules.rules import (
 from eva.experimental.ray.optimizer.rules.rules import (
     LogicalProjectToPhysical as DistributedLogicalProjectToPhysical,
 )
+from eva.optimizer.operators import OperatorType
 from eva.optimizer.rules.rules import (
     EmbedFilterIntoGet,
     EmbedProjectIntoGet,
@@ -60,6 +64,7 @@ from eva.optimizer.rules.rules import (
     LogicalUploadToPhysical,
     PushDownFilterThroughJoin,
 )
+from eva.optimizer.rules.rules_base import Rule
 
 
 class RulesManager:
@@ -67,26 +72,44 @@ class RulesManager:
 
     _instance = None
 
+    __slots__ = (
+        "_initialized",
+        "_logical_rules",
+        "_rewrite_rules",
+        "_implementation_rules",
+        "_all_rules",
+        "_rewrite_rules_by_shape",
+        "_logical_rules_by_shape",
+        "_implementation_rules_by_shape",
+    )
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(RulesManager, cls).__new__(cls)
         return cls._instance
 
     def __init__(self):
-        self._logical_rules = [LogicalInnerJoinCommutativity()]
+        # __init__ runs on every RulesManager() call, build the rules once
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
 
-        self._rewrite_rules = [
+        # the rules are kept in tuples so that callers cannot mutate them
+        # behind the buckets below
+        self._logical_rules = (LogicalInnerJoinCommutativity(),)
+
+        self._rewrite_rules = (
             EmbedFilterIntoGet(),
             # EmbedFilterIntoDerivedGet(),
             EmbedProjectIntoGet(),
             # EmbedProjectIntoDerivedGet(),
             EmbedSampleIntoGet(),
             PushDownFilterThroughJoin(),
-        ]
+        )
 
         ray_enabled = ConfigurationManager().get_value("experimental", "ray")
 
-        self._implementation_rules = [
+        implementation_rules = [
             LogicalCreateToPhysical(),
             LogicalRenameToPhysical(),
             LogicalDropToPhysical(),
@@ -117,11 +140,46 @@ class RulesManager:
         ]
 
         if ray_enabled:
-            self._implementation_rules.append(LogicalExchangeToPhysical())
+            implementation_rules.append(LogicalExchangeToPhysical())
+        self._implementation_rules = tuple(implementation_rules)
         self._all_rules = (
             self._rewrite_rules + self._logical_rules + self._implementation_rules
         )
 
+        # bucket the rules by the operator type and the number of children at
+        # the root of their pattern so that the optimizer does not need to
+        # probe every rule
+        self._rewrite_rules_by_shape = self._group_by_root_shape(self._rewrite_rules)
+        self._logical_rules_by_shape = self._group_by_root_shape(self._logical_rules)
+        self._implementation_rules_by_shape = self._group_by_root_shape(
+            self._implementation_rules
+        )
+
+    @staticmethod
+    def _rules_for(
+        rules_by_shape: Dict[Tuple[OperatorType, int], Tuple[Rule, ...]],
+        opr_type: OperatorType,
+        arity: Optional[int],
+    ) -> Tuple[Rule, ...]:
+        if arity is not None:
+            return rules_by_shape.get((opr_type, arity), ())
+        # any arity, collected from the shape buckets of the operator type
+        return tuple(
+            rule
+            for (root_type, _), rules in rules_by_shape.items()
+            if root_type is opr_type
+            for rule in rules
+        )
+
+    @staticmethod
+    def _group_by_root_shape(
+        rules: Tuple[Rule, ...],
+    ) -> Dict[Tuple[OperatorType, int], Tuple[Rule, ...]]:
+        rules_by_shape = defaultdict(list)
+        for rule in rules:
+            rules_by_shape[(rule.pattern.opr_type, rule.pattern.arity)].append(rule)
+        return {key: tuple(bucket) for key, bucket in rules_by_shape.items()}
+
     @property
     def rewrite_rules(self):
         return self._rewrite_rules
@@ -137,3 +195,20 @@ class RulesManager:
     @property
     def all_rules(self):
         return self._all_rules
+
+    # the rules rooted at opr_type; if arity is given, only the ones whose root
+    # has that many children, as the binder would reject the others
+    def rewrite_rules_for(
+        self, opr_type: OperatorType, arity: Optional[int] = None
+    ) -> Tuple[Rule, ...]:
+        return self._rules_for(self._rewrite_rules_by_shape, opr_type, arity)
+
+    def implementation_rules_for(
+        self, opr_type: OperatorType, arity: Optional[int] = None
+    ) -> Tuple[Rule, ...]:
+        return self._rules_for(self._implementation_rules_by_shape, opr_type, arity)
+
+    def logical_rules_for(
+        self, opr_type: OperatorType, arity: Optional[int] = None
+    ) -> Tuple[Rule, ...]:
+        return self._rules_for(self._logical_rules_by_shape, opr_type, arity)
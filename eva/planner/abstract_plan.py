@@ -19,8 +19,10 @@ from eva.planner.types import PlanOprType
 
 
 class AbstractPlan(ABC):
-    def __init__(self, opr_type):
-        self._children = []
+    __slots__ = ("_children", "_parent", "_opr_type")
+
+    def __init__(self, opr_type, children: List["AbstractPlan"] = None):
+        self._children = children or []
         self._parent = None
         self._opr_type = opr_type
 
@@ -80,13 +82,21 @@ class AbstractPlan(ABC):
     def __str__(self) -> str:
         return "AbstractPlan"
 
+    def _attribute_names(self):
+        # plans declare __slots__, subclasses without them also have a __dict__
+        for klass in type(self).__mro__:
+            for k in klass.__dict__.get("__slots__", ()):
+                if hasattr(self, k):
+                    yield k
+        yield from getattr(self, "__dict__", {})
+
     def __copy__(self):
         # deepcopy the children
         cls = self.__class__
         result = cls.__new__(cls)
-        for k, v in self.__dict__.items():
+        for k in self._attribute_names():
             if k == "_children":
                 setattr(result, k, [])
             else:
-                setattr(result, k, v)
+                setattr(result, k, getattr(self, k))
         return result
@@ -16,6 +16,8 @@
 https://www.postgresql.org/docs/9.1/using-explain.html
 https://www.postgresql.org/docs/9.5/runtime-config-query.html
 """
+from typing import List
+
 from eva.expression.abstract_expression import AbstractExpression
 from eva.planner.abstract_plan import AbstractPlan
 from eva.planner.types import PlanOprType
@@ -26,10 +28,18 @@ class AbstractScan(AbstractPlan):
 
     Arguments:
         predicate (AbstractExpression): An expression used for filtering
+        children (List[AbstractPlan]): child plans of the scan
     """
 
-    def __init__(self, opr_type: PlanOprType, predicate: AbstractExpression):
-        super(AbstractScan, self).__init__(opr_type)
+    __slots__ = ("_predicate",)
+
+    def __init__(
+        self,
+        opr_type: PlanOprType,
+        predicate: AbstractExpression,
+        children: List[AbstractPlan] = None,
+    ):
+        super(AbstractScan, self).__init__(opr_type, children)
         self._predicate = predicate
 
     @property
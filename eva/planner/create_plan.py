@@ -30,6 +30,8 @@ class CreatePlan(AbstractPlan):
         if_not_exists {bool} -- Whether to override if there is existing table
     """
 
+    __slots__ = ("_table_info", "_column_list", "_if_not_exists")
+
     def __init__(
         self,
         table_info: TableInfo,
@@ -42,6 +42,15 @@ class CreateUDFPlan(AbstractPlan):
             udf type. it ca be object detection, classification etc.
     """
 
+    __slots__ = (
+        "_name",
+        "_if_not_exists",
+        "_inputs",
+        "_outputs",
+        "_impl_path",
+        "_udf_type",
+    )
+
     def __init__(
         self,
         name: str,
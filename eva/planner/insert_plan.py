@@ -32,6 +32,8 @@ class InsertPlan(AbstractPlan):
                                                 for the values to insert
     """
 
+    __slots__ = ("table_metainfo", "columns_list", "value_list")
+
     def __init__(
         self,
         table_metainfo: DataFrameMetadata,
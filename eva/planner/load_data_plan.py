@@ -32,6 +32,14 @@ class LoadDataPlan(AbstractPlan):
         batch_mem_size(int): memory size of the batch loaded from disk
     """
 
+    __slots__ = (
+        "_table_info",
+        "_file_path",
+        "_batch_mem_size",
+        "_column_list",
+        "_file_options",
+    )
+
     def __init__(
         self,
         table_info: TableInfo,
@@ -15,6 +15,7 @@
 from typing import List
 
 from eva.expression.abstract_expression import AbstractExpression
+from eva.planner.abstract_plan import AbstractPlan
 from eva.planner.abstract_scan_plan import AbstractScan
 from eva.planner.types import PlanOprType
 
@@ -29,17 +30,22 @@ class SeqScanPlan(AbstractScan):
             list of column names string in the plan
         predicate: AbstractExpression
             An expression used for filtering
+        children: List[AbstractPlan]
+            child plans of the scan
     """
 
+    __slots__ = ("_columns", "alias")
+
     def __init__(
         self,
         predicate: AbstractExpression,
         columns: List[AbstractExpression],
         alias: str = None,
+        children: List[AbstractPlan] = None,
     ):
         self._columns = columns
         self.alias = alias
-        super().__init__(PlanOprType.SEQUENTIAL_SCAN, predicate)
+        super().__init__(PlanOprType.SEQUENTIAL_SCAN, predicate, children)
 
     @property
     def columns(self):
@@ -34,6 +34,18 @@ class StoragePlan(AbstractPlan):
         sampling_rate (int): uniform sampling rate
     """
 
+    __slots__ = (
+        "_table",
+        "_batch_mem_size",
+        "_skip_frames",
+        "_offset",
+        "_limit",
+        "_total_shards",
+        "_curr_shard",
+        "_predicate",
+        "_sampling_rate",
+    )
+
     def __init__(
         self,
         table: DataFrameMetadata,
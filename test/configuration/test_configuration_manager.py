@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import unittest
+from unittest.mock import patch
 
 import pytest
 
@@ -45,3 +46,9 @@ class ConfigurationManagerTests(unittest.TestCase):
 
         # reset value after updating
         self.config.update_value("core", "mode", value)
+
+    def test_configuration_manager_caches_parsed_file(self):
+        value = self.config.get_value("core", "mode")
+        with patch("eva.configuration.configuration_manager.yaml.load") as mock_load:
+            self.assertEqual(self.config.get_value("core", "mode"), value)
+            mock_load.assert_not_called()
@@ -25,13 +25,22 @@ from mock import MagicMock
 from eva.catalog.catalog_manager import CatalogManager
 from eva.configuration.configuration_manager import ConfigurationManager
 from eva.experimental.ray.optimizer.rules.rules import LogicalExchangeToPhysical
-from eva.expression.expression_utils import expression_tree_to_conjunction_list
+from eva.expression.abstract_expression import ExpressionType
+from eva.expression.comparison_expression import ComparisonExpression
+from eva.expression.constant_value_expression import ConstantValueExpression
+from eva.expression.expression_utils import (
+    conjuction_list_to_expression_tree,
+    expression_tree_to_conjunction_list,
+)
+from eva.expression.tuple_value_expression import TupleValueExpression
 from eva.optimizer.operators import (
     LogicalFilter,
     LogicalGet,
     LogicalProject,
     LogicalQueryDerivedGet,
+    OperatorType,
 )
+from eva.optimizer.rules.pattern import Pattern
 from eva.optimizer.rules.rules import (
     EmbedFilterIntoDerivedGet,
     EmbedFilterIntoGet,
@@ -66,6 +75,7 @@ from eva.optimizer.rules.rules import (
     PushDownFilterThroughJoin,
 )
 from eva.optimizer.rules.rules_manager import RulesManager
+from eva.parser.alias import Alias
 from eva.server.command_handler import execute_query_fetch_all
 
 
@@ -144,6 +154,16 @@ class TestRules(unittest.TestCase):
             Promise.LOGICAL_EXPLAIN_TO_PHYSICAL < Promise.IMPLEMENTATION_DELIMETER
         )
 
+    def test_rule_promise_is_cached_int(self):
+        rule = EmbedFilterIntoGet()
+        self.assertIs(type(rule.promise()), int)
+        self.assertEqual(rule.promise(), Promise.EMBED_FILTER_INTO_GET)
+        self.assertEqual(
+            LogicalGetToSeqScan().promise(), Promise.LOGICAL_GET_TO_SEQSCAN
+        )
+        for rule in RulesManager().all_rules:
+            self.assertIs(type(rule.promise()), int)
+
     def test_supported_rules(self):
         # adding/removing rules should update this test
         supported_rewrite_rules = [
@@ -215,6 +235,80 @@ class TestRules(unittest.TestCase):
                 )
             )
 
+    def test_rules_manager_builds_rules_once(self):
+        rules_manager = RulesManager()
+        rewrite_rules = rules_manager.rewrite_rules
+        self.assertIs(RulesManager(), rules_manager)
+        self.assertIs(RulesManager().rewrite_rules, rewrite_rules)
+
+    def test_rules_manager_rules_are_immutable(self):
+        rules_manager = RulesManager()
+        self.assertIsInstance(rules_manager.rewrite_rules, tuple)
+        self.assertIsInstance(rules_manager.logical_rules, tuple)
+        self.assertIsInstance(rules_manager.implementation_rules, tuple)
+        self.assertIsInstance(rules_manager.all_rules, tuple)
+        with self.assertRaises(AttributeError):
+            rules_manager.extra_rules = []
+
+    def test_rules_bucketed_by_root_type(self):
+        rules_manager = RulesManager()
+        for rule in rules_manager.implementation_rules:
+            self.assertIn(
+                rule, rules_manager.implementation_rules_for(rule.pattern.opr_type)
+            )
+        for rule in rules_manager.rewrite_rules:
+            self.assertIn(rule, rules_manager.rewrite_rules_for(rule.pattern.opr_type))
+
+        join_rules = rules_manager.implementation_rules_for(OperatorType.LOGICALJOIN)
+        for rule in join_rules:
+            self.assertEqual(rule.pattern.opr_type, OperatorType.LOGICALJOIN)
+        self.assertEqual(rules_manager.rewrite_rules_for(OperatorType.DUMMY), ())
+
+    def test_rules_bucketed_by_root_arity(self):
+        rules_manager = RulesManager()
+        for rule in rules_manager.implementation_rules:
+            opr_type, arity = rule.pattern.opr_type, rule.pattern.arity
+            self.assertIn(rule, rules_manager.implementation_rules_for(opr_type, arity))
+            self.assertNotIn(
+                rule, rules_manager.implementation_rules_for(opr_type, arity + 1)
+            )
+
+    def test_top_match_on_root_type(self):
+        rule = EmbedProjectIntoGet()
+        logi_get = LogicalGet(MagicMock(), MagicMock(), MagicMock())
+        self.assertTrue(rule.top_match(LogicalProject([], [logi_get])))
+        self.assertFalse(rule.top_match(logi_get))
+
+    def test_equal_patterns_share_hash(self):
+        pattern = LogicalInnerJoinCommutativity().pattern
+        other = LogicalJoinToPhysicalHashJoin().pattern
+        self.assertIsNot(pattern, other)
+        self.assertEqual(pattern, other)
+        self.assertEqual(hash(pattern), hash(other))
+        self.assertEqual(len({pattern, other}), 1)
+        self.assertNotEqual(pattern, LogicalGetToSeqScan().pattern)
+
+    def test_pattern_frozen_after_hash(self):
+        pattern = Pattern(OperatorType.LOGICALFILTER)
+        child = Pattern(OperatorType.LOGICALGET)
+        pattern.append_child(child)
+        hash(pattern)
+        # the parent's cached hash covers its children as well
+        with self.assertRaises(AssertionError):
+            child.append_child(Pattern(OperatorType.DUMMY))
+        with self.assertRaises(AssertionError):
+            pattern.append_child(Pattern(OperatorType.DUMMY))
+
+    def test_pattern_equality_does_not_freeze(self):
+        pattern = Pattern(OperatorType.LOGICALFILTER)
+        other = Pattern(OperatorType.LOGICALFILTER)
+        self.assertEqual(pattern, other)
+        # both patterns can still be extended after being compared
+        pattern.append_child(Pattern(OperatorType.LOGICALGET))
+        self.assertNotEqual(pattern, other)
+        other.append_child(Pattern(OperatorType.LOGICALGET))
+        self.assertEqual(pattern, other)
+
     # EmbedProjectIntoGet
     def test_simple_project_into_get(self):
         rule = EmbedProjectIntoGet()
@@ -227,6 +321,7 @@ class TestRules(unittest.TestCase):
 
         rewrite_opr = rule.apply(logi_project, MagicMock())
         self.assertFalse(rewrite_opr is logi_get)
+        self.assertFalse(rewrite_opr.children is logi_get.children)
         self.assertEqual(rewrite_opr.target_list, [expr1, expr2, expr3])
 
     # EmbedFilterIntoGet
@@ -241,6 +336,42 @@ class TestRules(unittest.TestCase):
         self.assertFalse(rewrite_opr is logi_get)
         self.assertEqual(rewrite_opr.predicate, predicate)
 
+    def test_filter_into_get_splits_conjunction(self):
+        rule = EmbedFilterIntoGet()
+        id_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            TupleValueExpression(col_name="id", col_alias="myvideo.id"),
+            ConstantValueExpression(2),
+        )
+        label_pred = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            TupleValueExpression(col_name="label", col_alias="myvideo.label"),
+            ConstantValueExpression("car"),
+        )
+        embedded_pred = ComparisonExpression(
+            ExpressionType.COMPARE_LESSER,
+            TupleValueExpression(col_name="id", col_alias="myvideo.id"),
+            ConstantValueExpression(10),
+        )
+        predicate = conjuction_list_to_expression_tree([id_pred, label_pred])
+
+        video = MagicMock()
+        video.alias = "myvideo"
+        logi_get = LogicalGet(
+            video, MagicMock(), Alias("myvideo"), predicate=embedded_pred
+        )
+        logi_filter = LogicalFilter(predicate, [logi_get])
+
+        rewrite_opr = rule.apply(logi_filter, MagicMock())
+        # the unsupported conjunct stays in a filter above the get
+        self.assertTrue(isinstance(rewrite_opr, LogicalFilter))
+        self.assertEqual(rewrite_opr.predicate, label_pred)
+        new_get = rewrite_opr.children[0]
+        self.assertEqual(
+            new_get.predicate,
+            conjuction_list_to_expression_tree([embedded_pred, id_pred]),
+        )
+
     # EmbedFilterIntoDerivedGet
     def test_simple_filter_into_derived_get(self):
         rule = EmbedFilterIntoDerivedGet()
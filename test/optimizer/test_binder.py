@@ -19,7 +19,13 @@ from mock import MagicMock
 
 from eva.optimizer.binder import Binder
 from eva.optimizer.cost_model import CostModel
-from eva.optimizer.operators import Dummy, LogicalFilter, LogicalGet, OperatorType
+from eva.optimizer.operators import (
+    Dummy,
+    LogicalFilter,
+    LogicalGet,
+    LogicalJoin,
+    OperatorType,
+)
 from eva.optimizer.optimizer_context import OptimizerContext
 from eva.optimizer.rules.pattern import Pattern
 
@@ -105,3 +111,53 @@ class TestBinder(unittest.TestCase):
         binder = Binder(sub_root_grp_expr, root_ptn, opt_ctxt.memo)
         for match in iter(binder):
             self.helper_pre_order_match(expected_match, match)
+
+    def test_binder_caches_group_pattern_match(self):
+        child_opr = LogicalGet(MagicMock(), MagicMock(), MagicMock())
+        root_opr = LogicalFilter(MagicMock(), [child_opr])
+
+        root_ptn = Pattern(OperatorType.LOGICALFILTER)
+        root_ptn.append_child(Pattern(OperatorType.LOGICALGET))
+
+        opt_ctxt = OptimizerContext(CostModel())
+        root_grp_expr = opt_ctxt.add_opr_to_group(root_opr)
+        memo = opt_ctxt.memo
+        root_grp_id = root_grp_expr.group_id
+        self.assertIsNone(memo.get_pattern_match(root_grp_id, root_ptn))
+
+        matches = list(iter(Binder(root_grp_expr, root_ptn, memo)))
+        self.assertEqual(len(matches), 1)
+        self.assertTrue(Binder._grp_match(root_grp_id, root_ptn, memo))
+        self.assertTrue(memo.get_pattern_match(root_grp_id, root_ptn))
+
+        # physical expressions do not affect structural matches
+        child_grp_id = root_grp_expr.children[0]
+        physical_expr = MagicMock()
+        physical_expr.opr.is_logical.return_value = False
+        memo.add_group_expr(physical_expr, child_grp_id)
+        self.assertTrue(memo.get_pattern_match(root_grp_id, root_ptn))
+
+        # modifying a child group should drop the parent's cached match
+        memo.erase_group(child_grp_id)
+        self.assertIsNone(memo.get_pattern_match(root_grp_id, root_ptn))
+
+    def test_binder_group_match_stops_at_first_failing_child(self):
+        left_opr = LogicalFilter(
+            MagicMock(), [LogicalGet(MagicMock(), MagicMock(), MagicMock())]
+        )
+        right_opr = LogicalGet(MagicMock(), MagicMock(), MagicMock())
+        join_opr = LogicalJoin(MagicMock(), children=[left_opr, right_opr])
+
+        join_ptn = Pattern(OperatorType.LOGICALJOIN)
+        join_ptn.append_child(Pattern(OperatorType.LOGICALGET))
+        join_ptn.append_child(Pattern(OperatorType.LOGICALGET))
+
+        opt_ctxt = OptimizerContext(CostModel())
+        join_grp_expr = opt_ctxt.add_opr_to_group(join_opr)
+        memo = opt_ctxt.memo
+        left_grp_id, right_grp_id = join_grp_expr.children
+
+        self.assertFalse(Binder._grp_match(join_grp_expr.group_id, join_ptn, memo))
+        self.assertFalse(memo.get_pattern_match(left_grp_id, join_ptn.children[0]))
+        # the left child already rejects the join, the right one is not visited
+        self.assertIsNone(memo.get_pattern_match(right_grp_id, join_ptn.children[1]))
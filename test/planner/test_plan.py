@@ -27,6 +27,8 @@ from eva.planner.drop_udf_plan import DropUDFPlan
 from eva.planner.insert_plan import InsertPlan
 from eva.planner.load_data_plan import LoadDataPlan
 from eva.planner.rename_plan import RenamePlan
+from eva.planner.seq_scan_plan import SeqScanPlan
+from eva.planner.storage_plan import StoragePlan
 from eva.planner.types import PlanOprType
 from eva.planner.union_plan import UnionPlan
 from eva.planner.upload_plan import UploadPlan
@@ -178,3 +180,13 @@ class PlanNodeTests(unittest.TestCase):
         self.assertEqual(plan.opr_type, PlanOprType.CREATE_MATERIALIZED_VIEW)
         self.assertEqual(plan.view, dummy_view)
         self.assertEqual(plan.columns, columns)
+
+    def test_seq_scan_plan_with_children(self):
+        storage_plan = StoragePlan(TableInfo("dummy"), batch_mem_size=10)
+        plan = SeqScanPlan(None, ["id"], "T", children=[storage_plan])
+        self.assertEqual(plan.opr_type, PlanOprType.SEQUENTIAL_SCAN)
+        self.assertEqual(plan.children, [storage_plan])
+        self.assertEqual(plan.alias, "T")
+
+        plan = SeqScanPlan(None, ["id"])
+        self.assertEqual(plan.children, [])